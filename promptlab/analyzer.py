@@ -17,17 +17,76 @@ from __future__ import annotations
 
 import math
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
 
 from promptlab.patterns import (
     ALL_PATTERNS,
-    CONSTRAINT_KEYWORDS,
-    CONTEXT_SIGNALS,
-    EXAMPLE_KEYWORDS,
-    OUTPUT_FORMAT_KEYWORDS,
-    ROLE_KEYWORDS,
+    AMBIGUOUS_PRONOUNS,
+    VAGUE_LANGUAGE,
     AntiPattern,
     Category,
+    Severity,
+    compile_bank,
+    scan_keyword_banks,
+)
+
+# Result objects are created per prompt, so slot them where supported (3.10+)
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Relative weight of each dimension in the overall score
+_DIMENSION_WEIGHTS: dict[str, float] = {
+    "Clarity": 0.30,
+    "Structure": 0.25,
+    "Specificity": 0.25,
+    "Length": 0.20,
+}
+
+# Quality label indexed by whole score: <2 Poor, <4 Weak, <6 Fair, <8 Good
+_LABEL_LUT: tuple[str, ...] = (
+    "Poor", "Poor", "Weak", "Weak", "Fair", "Fair",
+    "Good", "Good", "Excellent", "Excellent", "Excellent",
+)
+
+# Suggestion bucket for each severity (highest severity first)
+_SEVERITY_ORDER: dict[Severity, int] = {Severity.HIGH: 0, Severity.MEDIUM: 1, Severity.LOW: 2}
+
+# Standalone numbers ("300 words", "3 takeaways") -- digits inside words don't count
+_NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Anti-patterns detected purely from their own regex/keyword signals; these
+# are matched once up front and shared by scoring and detection
+_SIGNAL_PATTERNS: tuple[AntiPattern, ...] = (VAGUE_LANGUAGE, AMBIGUOUS_PRONOUNS)
+
+# Longest prompt whose analysis is cached; caps what the cache can pin
+_CACHE_MAX_CHARS = 10_000
+
+# Sentence-ending punctuation followed by whitespace or end of text
+_SENTENCE_END_RE = re.compile(r'[.!?]+(?:\s|$)')
+
+# Imperative verbs that define a task. The structure score also accepts a
+# few writing verbs; the multiple-requests heuristic a few conversational ones.
+_TASK_VERBS: tuple[str, ...] = (
+    "write", "create", "generate", "build", "make", "list", "explain",
+    "describe", "summarize", "translate", "convert", "fix", "improve",
+    "update", "edit", "rewrite", "design", "develop", "analyze", "compare",
+    "review",
+)
+
+# Any task verb anywhere (matched against lowercased text)
+_TASK_VERB_RE = compile_bank(
+    _TASK_VERBS + ("draft", "compose", "produce", "outline", "calculate"), flags=0
+)
+
+# Task verbs that start a clause, allowing transition words before the verb
+_TASK_STARTER_RE = re.compile(
+    r'(?:^|[.!?]\s+|\n\s*)'
+    r'(?:(?:and\s+)?(?:also\s+|can\s+you\s+(?:also\s+)?)?)?'
+    r'(?:' + '|'.join(_TASK_VERBS + ("help", "tell", "give")) + r')\b',
+    re.I,
 )
 
 
@@ -35,7 +94,28 @@ from promptlab.patterns import (
 # Result data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+def _score_label(score: float) -> str:
+    if not score >= 2.0:  # also NaN
+        return "Poor"
+    return _LABEL_LUT[int(min(score, 10.0))]
+
+
+def _weighted_score(dimensions: list[DimensionScore]) -> float:
+    """Weighted average across all dimensions."""
+    if not dimensions:
+        return 0.0
+
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for dim in dimensions:
+        w = _DIMENSION_WEIGHTS.get(dim.name, 0.25)
+        weighted_sum += dim.score * w
+        total_weight += w
+
+    return round(weighted_sum / total_weight, 1) if total_weight else 0.0
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DimensionScore:
     """Score for a single analysis dimension."""
 
@@ -50,28 +130,36 @@ class DimensionScore:
 
     @property
     def label(self) -> str:
-        if self.score >= 8:
-            return "Excellent"
-        if self.score >= 6:
-            return "Good"
-        if self.score >= 4:
-            return "Fair"
-        if self.score >= 2:
-            return "Weak"
-        return "Poor"
+        return _score_label(self.score)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "score": self.score,
+            "max_score": self.max_score,
+            "label": self.label,
+            "details": self.details,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DetectedAntiPattern:
     """An anti-pattern that was found in the prompt."""
 
     pattern: AntiPattern
     evidence: str = ""  # the matched text that triggered detection
 
+    def to_dict(self) -> dict[str, str]:
+        return {**self.pattern.to_dict(), "evidence": self.evidence}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AnalysisResult:
-    """Complete analysis of a single prompt."""
+    """Complete analysis of a single prompt.
+
+    ``overall_score`` is computed from ``dimensions`` when the result is
+    constructed.
+    """
 
     prompt: str
     dimensions: list[DimensionScore] = field(default_factory=list)
@@ -79,40 +167,27 @@ class AnalysisResult:
     suggestions: list[str] = field(default_factory=list)
     word_count: int = 0
     sentence_count: int = 0
+    overall_score: float = field(init=False, default=0.0)
 
-    @property
-    def overall_score(self) -> float:
-        """Weighted average across all dimensions."""
-        if not self.dimensions:
-            return 0.0
-
-        weights = {
-            "Clarity": 0.30,
-            "Structure": 0.25,
-            "Specificity": 0.25,
-            "Length": 0.20,
-        }
-        total_weight = 0.0
-        weighted_sum = 0.0
-        for dim in self.dimensions:
-            w = weights.get(dim.name, 0.25)
-            weighted_sum += dim.score * w
-            total_weight += w
-
-        return round(weighted_sum / total_weight, 1) if total_weight else 0.0
+    def __post_init__(self) -> None:
+        self.overall_score = _weighted_score(self.dimensions)
 
     @property
     def overall_label(self) -> str:
-        s = self.overall_score
-        if s >= 8:
-            return "Excellent"
-        if s >= 6:
-            return "Good"
-        if s >= 4:
-            return "Fair"
-        if s >= 2:
-            return "Weak"
-        return "Poor"
+        return _score_label(self.overall_score)
+
+    def to_dict(self) -> dict[str, object]:
+        """The full result as JSON-ready values, including derived labels."""
+        return {
+            "prompt": self.prompt,
+            "overall_score": self.overall_score,
+            "overall_label": self.overall_label,
+            "word_count": self.word_count,
+            "sentence_count": self.sentence_count,
+            "dimensions": [d.to_dict() for d in self.dimensions],
+            "anti_patterns": [d.to_dict() for d in self.anti_patterns],
+            "suggestions": list(self.suggestions),
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -123,18 +198,17 @@ def _count_words(text: str) -> int:
     return len(text.split())
 
 
-def _count_sentences(text: str) -> int:
-    # Split on sentence-ending punctuation followed by whitespace or end
-    parts = re.split(r'[.!?]+(?:\s|$)', text.strip())
-    return max(1, len([p for p in parts if p.strip()]))
+def _count_lines(text: str) -> int:
+    return sum(1 for line in text.split("\n") if line.strip())
 
 
-def _has_any_keyword(text_lower: str, keywords: tuple[str, ...]) -> bool:
-    return any(kw in text_lower for kw in keywords)
+def _count_numbers(text: str) -> int:
+    return len(_NUMBER_RE.findall(text))
 
 
-def _count_keyword_hits(text_lower: str, keywords: tuple[str, ...]) -> int:
-    return sum(1 for kw in keywords if kw in text_lower)
+def _count_sentences(text: str) -> int:
+    parts = _SENTENCE_END_RE.split(text.strip())
+    return max(1, len([p for p in parts if p.strip()]))
 
 
 def _count_distinct_tasks(text: str) -> int:
@@ -144,28 +218,66 @@ def _count_distinct_tasks(text: str) -> int:
     optional transition words like 'also', 'and', 'can you'), question
     marks, and explicit task-separator phrases.
     """
-    verb_pattern = (
-        r'(write|create|generate|build|make|list|explain|describe|summarize|'
-        r'translate|convert|fix|improve|update|edit|rewrite|help|tell|give|'
-        r'design|develop|analyze|compare|review)'
-    )
-    # Match verbs at sentence starts, allowing transition words before the verb
-    task_starters = re.findall(
-        r'(?:^|[.!?]\s+|\n\s*)'
-        r'(?:(?:and\s+)?(?:also\s+|can\s+you\s+(?:also\s+)?)?)?'
-        + verb_pattern + r'\b',
-        text,
-        re.I,
-    )
+    task_starters = _TASK_STARTER_RE.findall(text)
     questions = text.count("?")
     return len(task_starters) + questions
 
 
+def _match_signals(ap: AntiPattern, text: str, text_lower: str) -> list[str]:
+    """Return evidence for every regex and keyword signal of ``ap`` that matches."""
+    evidence: list[str] = []
+    if ap.signal_re is None or ap.signal_re.search(text):
+        for pattern in ap.positive_signals:
+            match = pattern.search(text)
+            if match:
+                evidence.append(f'Matched: "{match.group()}"')
+
+    for kw in ap.keyword_signals:
+        if kw in text_lower:
+            evidence.append(f'Contains: "{kw}"')
+
+    return evidence
+
+
+def _scan_signals(
+    text: str,
+    text_lower: str,
+    signal_matches: dict[str, list[str]],
+) -> dict[str, int]:
+    """Run every detection scan over the prompt exactly once.
+
+    Scoring and anti-pattern detection both read from the returned dict
+    instead of re-scanning the text. Presence checks are stored as
+    booleans, everything else as counts. Signal-driven anti-patterns are
+    read from ``signal_matches``, which holds their already-matched evidence.
+
+    ``text_lower`` is lowercased once by ``analyze``. Keyword banks and the
+    task-verb regex scan it case-sensitively; regexes whose match is quoted
+    as evidence run on ``text`` with ``re.I`` to keep the original casing.
+    """
+    keyword_hits = scan_keyword_banks(text_lower)
+    return {
+        "has_role": bool(keyword_hits["role"]),
+        "has_context": bool(keyword_hits["context"]),
+        "has_output_format": bool(keyword_hits["output_format"]),
+        "has_examples": bool(keyword_hits["example"]),
+        "constraint_hits": len(keyword_hits["constraint"]),
+        "has_task_verb": _TASK_VERB_RE.search(text_lower) is not None,
+        "vague_hits": len(signal_matches[VAGUE_LANGUAGE.id]),
+        "has_ambiguous_pronoun": bool(signal_matches[AMBIGUOUS_PRONOUNS.id]),
+        "distinct_tasks": _count_distinct_tasks(text),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Scoring functions
 # ---------------------------------------------------------------------------
 
-def _score_clarity(text: str, text_lower: str) -> DimensionScore:
+def _score_clarity(
+    word_count: int,
+    number_hits: int,
+    signals: dict[str, int],
+) -> DimensionScore:
     """Score how clear and unambiguous the prompt is.
 
     Factors: absence of vague language, sentence complexity, use of
@@ -175,16 +287,7 @@ def _score_clarity(text: str, text_lower: str) -> DimensionScore:
     details_parts: list[str] = []
 
     # Penalize vague language
-    from promptlab.patterns import VAGUE_LANGUAGE
-
-    vague_hits = 0
-    for pattern in VAGUE_LANGUAGE.positive_signals:
-        if pattern.search(text):
-            vague_hits += 1
-    for kw in VAGUE_LANGUAGE.keyword_signals:
-        if kw in text_lower:
-            vague_hits += 1
-
+    vague_hits = signals["vague_hits"]
     if vague_hits >= 3:
         score -= 4.0
         details_parts.append("Multiple vague phrases detected")
@@ -193,7 +296,6 @@ def _score_clarity(text: str, text_lower: str) -> DimensionScore:
         details_parts.append(f"{vague_hits} vague phrase(s) detected")
 
     # Penalize very short prompts (< 5 words) -- too ambiguous
-    word_count = _count_words(text)
     if word_count < 5:
         score -= 3.0
         details_parts.append("Extremely short -- likely too ambiguous")
@@ -202,19 +304,14 @@ def _score_clarity(text: str, text_lower: str) -> DimensionScore:
         details_parts.append("Very short -- may lack clarity")
 
     # Reward specificity signals (numbers, proper nouns, technical terms)
-    numbers = len(re.findall(r'\b\d+\b', text))
-    if numbers >= 2:
+    if number_hits >= 2:
         score += 1.0
         details_parts.append("Contains numeric specifics")
 
     # Penalize ambiguous pronoun starts
-    from promptlab.patterns import AMBIGUOUS_PRONOUNS
-
-    for pattern in AMBIGUOUS_PRONOUNS.positive_signals:
-        if pattern.search(text):
-            score -= 1.5
-            details_parts.append("Starts with an ambiguous pronoun reference")
-            break
+    if signals["has_ambiguous_pronoun"]:
+        score -= 1.5
+        details_parts.append("Starts with an ambiguous pronoun reference")
 
     score = max(1.0, min(10.0, score))
     return DimensionScore(
@@ -224,7 +321,7 @@ def _score_clarity(text: str, text_lower: str) -> DimensionScore:
     )
 
 
-def _score_structure(text: str, text_lower: str) -> DimensionScore:
+def _score_structure(signals: dict[str, int]) -> DimensionScore:
     """Score whether the prompt has the key structural components.
 
     Components: role/persona, context, task definition, output format.
@@ -235,34 +332,28 @@ def _score_structure(text: str, text_lower: str) -> DimensionScore:
     missing: list[str] = []
 
     # Role / persona
-    if _has_any_keyword(text_lower, ROLE_KEYWORDS):
+    if signals["has_role"]:
         score += 2.5
         present.append("role")
     else:
         missing.append("role/persona")
 
     # Context
-    if _has_any_keyword(text_lower, CONTEXT_SIGNALS):
+    if signals["has_context"]:
         score += 2.5
         present.append("context")
     else:
         missing.append("context/background")
 
     # Clear task (has at least one imperative verb)
-    task_verbs = re.findall(
-        r'\b(write|create|generate|build|make|list|explain|describe|summarize|'
-        r'translate|convert|fix|improve|update|edit|rewrite|analyze|compare|'
-        r'design|develop|review|draft|compose|produce|outline|calculate)\b',
-        text_lower,
-    )
-    if task_verbs:
+    if signals["has_task_verb"]:
         score += 2.5
         present.append("task")
     else:
         missing.append("clear task verb")
 
     # Output format
-    if _has_any_keyword(text_lower, OUTPUT_FORMAT_KEYWORDS):
+    if signals["has_output_format"]:
         score += 2.5
         present.append("output format")
     else:
@@ -277,7 +368,11 @@ def _score_structure(text: str, text_lower: str) -> DimensionScore:
     return DimensionScore(name="Structure", score=round(score, 1), details=detail_str.strip(". "))
 
 
-def _score_specificity(text: str, text_lower: str) -> DimensionScore:
+def _score_specificity(
+    number_hits: int,
+    line_count: int,
+    signals: dict[str, int],
+) -> DimensionScore:
     """Score how specific and constrained the prompt is.
 
     Factors: constraints/boundaries, examples, quantitative details,
@@ -287,7 +382,7 @@ def _score_specificity(text: str, text_lower: str) -> DimensionScore:
     details_parts: list[str] = []
 
     # Constraints
-    constraint_hits = _count_keyword_hits(text_lower, CONSTRAINT_KEYWORDS)
+    constraint_hits = signals["constraint_hits"]
     if constraint_hits >= 5:
         score += 3.0
         details_parts.append("Strong constraints present")
@@ -301,23 +396,21 @@ def _score_specificity(text: str, text_lower: str) -> DimensionScore:
         details_parts.append("No constraints detected")
 
     # Examples
-    if _has_any_keyword(text_lower, EXAMPLE_KEYWORDS):
+    if signals["has_examples"]:
         score += 2.5
         details_parts.append("Includes examples")
     else:
         details_parts.append("No examples provided")
 
     # Quantitative specifics
-    numbers = len(re.findall(r'\b\d+\b', text))
-    if numbers >= 3:
+    if number_hits >= 3:
         score += 1.5
         details_parts.append("Multiple numeric details")
-    elif numbers >= 1:
+    elif number_hits >= 1:
         score += 0.75
 
     # Multi-line / structured input (shows effort)
-    lines = [l for l in text.strip().split("\n") if l.strip()]
-    if len(lines) >= 5:
+    if line_count >= 5:
         score += 1.0
         details_parts.append("Well-structured multi-line prompt")
 
@@ -329,14 +422,12 @@ def _score_specificity(text: str, text_lower: str) -> DimensionScore:
     )
 
 
-def _score_length(text: str) -> DimensionScore:
+def _score_length(word_count: int) -> DimensionScore:
     """Score prompt length -- penalize extremes, reward the sweet spot.
 
     Sweet spot heuristic: 20-300 words for most tasks.
     Very short (<10 words) or very long (>500 words) are penalized.
     """
-    word_count = _count_words(text)
-
     if word_count < 5:
         score = 2.0
         detail = f"{word_count} words -- too short to convey a meaningful task"
@@ -370,64 +461,51 @@ def _score_length(text: str) -> DimensionScore:
 # Anti-pattern detection
 # ---------------------------------------------------------------------------
 
-def _detect_anti_patterns(text: str, text_lower: str) -> list[DetectedAntiPattern]:
+# Anti-patterns detected by the *absence* of a scanned signal:
+# pattern id -> (signal name, evidence)
+_ABSENCE_CHECKS: dict[str, tuple[str, str]] = {
+    "missing_role": ("has_role", "No role or persona assignment found"),
+    "missing_output_format": ("has_output_format", "No output format specification found"),
+    "missing_context": ("has_context", "No contextual background found"),
+    "no_constraints": ("constraint_hits", "No constraint or boundary keywords found"),
+    "no_examples": ("has_examples", "No example or sample output found"),
+}
+
+
+def _detect_anti_patterns(
+    text: str,
+    text_lower: str,
+    signals: dict[str, int],
+    signal_matches: dict[str, list[str]],
+) -> list[DetectedAntiPattern]:
     """Run all defined anti-pattern checks against the prompt."""
     detected: list[DetectedAntiPattern] = []
 
     for ap in ALL_PATTERNS:
-        found = False
         evidence = ""
 
         # -- Patterns detected by ABSENCE of keywords --
-        if ap.id == "missing_role":
-            if not _has_any_keyword(text_lower, ROLE_KEYWORDS):
-                found = True
-                evidence = "No role or persona assignment found"
-
-        elif ap.id == "missing_output_format":
-            if not _has_any_keyword(text_lower, OUTPUT_FORMAT_KEYWORDS):
-                found = True
-                evidence = "No output format specification found"
-
-        elif ap.id == "missing_context":
-            if not _has_any_keyword(text_lower, CONTEXT_SIGNALS):
-                found = True
-                evidence = "No contextual background found"
-
-        elif ap.id == "no_constraints":
-            if _count_keyword_hits(text_lower, CONSTRAINT_KEYWORDS) == 0:
-                found = True
-                evidence = "No constraint or boundary keywords found"
-
-        elif ap.id == "no_examples":
-            if not _has_any_keyword(text_lower, EXAMPLE_KEYWORDS):
-                found = True
-                evidence = "No example or sample output found"
+        absence = _ABSENCE_CHECKS.get(ap.id)
+        if absence is not None:
+            signal, message = absence
+            if not signals[signal]:
+                evidence = message
 
         # -- Patterns detected by PRESENCE of signals --
         elif ap.id == "multiple_requests":
-            distinct = _count_distinct_tasks(text)
+            distinct = signals["distinct_tasks"]
             if distinct >= 3:
-                found = True
                 evidence = f"Detected ~{distinct} distinct tasks/requests"
 
         else:
-            # Generic: check regex and keyword signals
-            for pattern in ap.positive_signals:
-                match = pattern.search(text)
-                if match:
-                    found = True
-                    evidence = f'Matched: "{match.group()}"'
-                    break
-
-            if not found:
-                for kw in ap.keyword_signals:
-                    if kw in text_lower:
-                        found = True
-                        evidence = f'Contains: "{kw}"'
-                        break
-
-        if found:
+            # Generic: regex and keyword signals, reusing matches from the scan
+            matches = signal_matches.get(ap.id)
+            if matches is None:
+                matches = _match_signals(ap, text, text_lower)
+            if matches:
+                evidence = matches[0]
+
+        if evidence:
             detected.append(DetectedAntiPattern(pattern=ap, evidence=evidence))
 
     return detected
@@ -445,20 +523,20 @@ def _generate_suggestions(
     suggestions: list[str] = []
     seen_ids: set[str] = set()
 
-    # Suggestions from anti-patterns (highest severity first)
-    severity_order = {"high": 0, "medium": 1, "low": 2}
-    sorted_patterns = sorted(
-        anti_patterns,
-        key=lambda d: severity_order.get(d.pattern.severity.value, 3),
-    )
-    for det in sorted_patterns:
-        if det.pattern.id not in seen_ids:
-            suggestions.append(det.pattern.suggestion)
-            seen_ids.add(det.pattern.id)
+    # Suggestions from anti-patterns (highest severity first), bucketed by
+    # severity so detection order is kept within each level
+    buckets: list[list[DetectedAntiPattern]] = [[], [], [], []]
+    for det in anti_patterns:
+        buckets[_SEVERITY_ORDER.get(det.pattern.severity, 3)].append(det)
+
+    for bucket in buckets:
+        for det in bucket:
+            if det.pattern.id not in seen_ids:
+                suggestions.append(det.pattern.suggestion)
+                seen_ids.add(det.pattern.id)
 
     # If all dimensions scored well but there's room for improvement
-    low_dims = [d for d in dimensions if d.score < 6.0]
-    if not low_dims and not suggestions:
+    if not suggestions and all(d.score >= 6.0 for d in dimensions):
         suggestions.append(
             "This is already a strong prompt. Consider adding edge-case "
             "handling or examples for even better results."
@@ -474,12 +552,23 @@ def _generate_suggestions(
 def analyze(prompt: str) -> AnalysisResult:
     """Analyze a prompt and return a complete scored result.
 
+    Results for prompts of up to 10,000 characters are cached (the most
+    recent 128), so a repeated prompt returns the same object.
+    Treat results as read-only: don't mutate the result or its lists.
+    Longer prompts are analyzed fresh each time so the cache stays small.
+
     Args:
         prompt: The raw prompt text to analyze.
 
     Returns:
         An AnalysisResult with scores, detected anti-patterns, and suggestions.
     """
+    if len(prompt) > _CACHE_MAX_CHARS:
+        return _analyze_uncached(prompt)
+    return _analyze_cached(prompt)
+
+
+def _analyze_uncached(prompt: str) -> AnalysisResult:
     text = prompt.strip()
     if not text:
         return AnalysisResult(
@@ -496,15 +585,21 @@ def analyze(prompt: str) -> AnalysisResult:
         )
 
     text_lower = text.lower()
+    word_count = _count_words(text)
+    number_hits = _count_numbers(text)
+    signal_matches = {
+        ap.id: _match_signals(ap, text, text_lower) for ap in _SIGNAL_PATTERNS
+    }
+    signals = _scan_signals(text, text_lower, signal_matches)
 
     dimensions = [
-        _score_clarity(text, text_lower),
-        _score_structure(text, text_lower),
-        _score_specificity(text, text_lower),
-        _score_length(text),
+        _score_clarity(word_count, number_hits, signals),
+        _score_structure(signals),
+        _score_specificity(number_hits, _count_lines(text), signals),
+        _score_length(word_count),
     ]
 
-    anti_patterns = _detect_anti_patterns(text, text_lower)
+    anti_patterns = _detect_anti_patterns(text, text_lower, signals, signal_matches)
     suggestions = _generate_suggestions(dimensions, anti_patterns)
 
     return AnalysisResult(
@@ -512,6 +607,27 @@ def analyze(prompt: str) -> AnalysisResult:
         dimensions=dimensions,
         anti_patterns=anti_patterns,
         suggestions=suggestions,
-        word_count=_count_words(text),
+        word_count=word_count,
         sentence_count=_count_sentences(text),
     )
+
+
+_analyze_cached = lru_cache(maxsize=128)(_analyze_uncached)
+
+
+def analyze_many(prompts: Iterable[str], workers: int | None = None) -> list[AnalysisResult]:
+    """Analyze a batch of prompts.
+
+    Args:
+        prompts: The raw prompt texts to analyze.
+        workers: Number of worker processes to spread the batch across.
+            ``None`` or ``1`` analyzes everything in the current process.
+
+    Returns:
+        One AnalysisResult per prompt, in input order.
+    """
+    if workers is None or workers <= 1:
+        return [analyze(prompt) for prompt in prompts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze, prompts, chunksize=64))
@@ -7,6 +7,7 @@ output format, and optional AI enhancement.
 from __future__ import annotations
 
 import sys
+from typing import TextIO
 
 import click
 from rich.console import Console
@@ -17,17 +18,37 @@ from promptlab.enhancer import EnhancerError, enhance
 from promptlab.reporter import render_json, render_markdown, render_text
 
 console = Console()
+err_console = Console(stderr=True)
+
+# Longer input is truncated before analysis to bound memory and CPU use
+MAX_PROMPT_CHARS = 1_000_000
+
+
+def _truncate(text: str, source: str) -> str:
+    """Cut the prompt to MAX_PROMPT_CHARS, warning on stderr if it was longer."""
+    if len(text) <= MAX_PROMPT_CHARS:
+        return text
+    err_console.print(
+        f"[yellow]Warning:[/] {source} is longer than {MAX_PROMPT_CHARS:,} characters; "
+        "only the beginning will be analyzed."
+    )
+    return text[:MAX_PROMPT_CHARS]
+
+
+def _read_bounded(stream: TextIO, source: str) -> str:
+    """Read at most one character past the limit, so huge input is never fully loaded."""
+    return _truncate(stream.read(MAX_PROMPT_CHARS + 1), source)
 
 
 def _read_prompt(prompt_text: str | None, file: str | None) -> str:
     """Resolve the prompt from the argument, a file, or stdin."""
     if prompt_text:
-        return prompt_text
+        return _truncate(prompt_text, "Prompt")
 
     if file:
         try:
             with open(file, "r", encoding="utf-8") as f:
-                return f.read()
+                return _read_bounded(f, file)
         except FileNotFoundError:
             console.print(f"[red]Error:[/] File not found: {file}")
             raise SystemExit(1)
@@ -37,7 +58,7 @@ def _read_prompt(prompt_text: str | None, file: str | None) -> str:
 
     # Try reading from stdin (piped input)
     if not sys.stdin.isatty():
-        return sys.stdin.read()
+        return _read_bounded(sys.stdin, "Input")
 
     console.print("[red]Error:[/] No prompt provided.")
     console.print("Pass a prompt as an argument, use --file, or pipe via stdin.")
@@ -11,12 +11,24 @@ Supported providers (set via PROMPTLAB_PROVIDER env var):
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 from dataclasses import dataclass
 
 from promptlab.analyzer import AnalysisResult
 
+# Labeled sections in the LLM response
+_IMPROVED_RE = re.compile(
+    r'(?:improved prompt|rewritten prompt|enhanced prompt)[:\s]*\n(.*?)(?=\n(?:explanation|what i changed|changes made)|$)',
+    re.I | re.S,
+)
+_EXPLANATION_RE = re.compile(
+    r'(?:explanation|what i changed|changes made)[:\s]*\n(.*)',
+    re.I | re.S,
+)
+
 
 @dataclass
 class EnhancementResult:
@@ -27,6 +39,14 @@ class EnhancementResult:
     provider: str
     model: str
 
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "improved_prompt": self.improved_prompt,
+            "explanation": self.explanation,
+            "provider": self.provider,
+            "model": self.model,
+        }
+
 
 class EnhancerError(Exception):
     """Raised when enhancement fails (missing key, API error, etc.)."""
@@ -53,17 +73,32 @@ def _build_system_message(result: AnalysisResult) -> str:
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Return an OpenAI client, reused across calls with the same key."""
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _anthropic_client(api_key: str):
+    """Return an Anthropic client, reused across calls with the same key."""
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def _enhance_openai(prompt: str, result: AnalysisResult, api_key: str) -> EnhancementResult:
     """Call OpenAI's ChatCompletion API."""
     try:
-        import openai
+        client = _openai_client(api_key)
     except ImportError:
         raise EnhancerError(
             "The 'openai' package is required for OpenAI enhancement. "
             "Install it with: pip install openai"
         )
 
-    client = openai.OpenAI(api_key=api_key)
     model = os.getenv("PROMPTLAB_MODEL", "gpt-4o-mini")
 
     try:
@@ -92,14 +127,13 @@ def _enhance_openai(prompt: str, result: AnalysisResult, api_key: str) -> Enhanc
 def _enhance_anthropic(prompt: str, result: AnalysisResult, api_key: str) -> EnhancementResult:
     """Call Anthropic's Messages API."""
     try:
-        import anthropic
+        client = _anthropic_client(api_key)
     except ImportError:
         raise EnhancerError(
             "The 'anthropic' package is required for Anthropic enhancement. "
             "Install it with: pip install anthropic"
         )
 
-    client = anthropic.Anthropic(api_key=api_key)
     model = os.getenv("PROMPTLAB_MODEL", "claude-sonnet-4-20250514")
 
     try:
@@ -130,19 +164,9 @@ def _parse_enhancement_response(content: str) -> tuple[str, str]:
     We look for common section markers. If we can't find a clean split,
     we treat the whole response as the improved prompt.
     """
-    import re
-
     # Try to find labeled sections
-    improved_match = re.search(
-        r'(?:improved prompt|rewritten prompt|enhanced prompt)[:\s]*\n(.*?)(?=\n(?:explanation|what i changed|changes made)|$)',
-        content,
-        re.I | re.S,
-    )
-    explanation_match = re.search(
-        r'(?:explanation|what i changed|changes made)[:\s]*\n(.*)',
-        content,
-        re.I | re.S,
-    )
+    improved_match = _IMPROVED_RE.search(content)
+    explanation_match = _EXPLANATION_RE.search(content)
 
     if improved_match and explanation_match:
         return improved_match.group(1).strip(), explanation_match.group(1).strip()
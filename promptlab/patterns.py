@@ -12,11 +12,27 @@ findings in a structured way.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:  # optional: single-pass keyword matching (pip install promptlab[fast])
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ahocorasick = None
 
-class Severity(Enum):
+# Patterns are slotted where dataclasses support it (3.10+)
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _StrEnum(str, Enum):
+    """Enum whose members are their string values (``enum.StrEnum`` is 3.11+)."""
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+
+class Severity(_StrEnum):
     """How much a detected anti-pattern hurts prompt quality."""
 
     LOW = "low"
@@ -24,7 +40,7 @@ class Severity(Enum):
     HIGH = "high"
 
 
-class Category(Enum):
+class Category(_StrEnum):
     """Broad grouping for anti-patterns."""
 
     STRUCTURE = "structure"
@@ -33,7 +49,7 @@ class Category(Enum):
     SCOPE = "scope"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AntiPattern:
     """A single detectable anti-pattern in a prompt."""
 
@@ -47,6 +63,25 @@ class AntiPattern:
     positive_signals: tuple[re.Pattern[str], ...] = field(default_factory=tuple)
     # Keywords / phrases (lowercase) that signal this anti-pattern
     keyword_signals: tuple[str, ...] = field(default_factory=tuple)
+    # positive_signals merged into one non-capturing alternation (prefilter)
+    signal_re: re.Pattern[str] | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        signals = self.positive_signals
+        if len(signals) > 1 and len({p.flags for p in signals}) == 1:
+            merged = re.compile("|".join(f"(?:{p.pattern})" for p in signals), signals[0].flags)
+            object.__setattr__(self, "signal_re", merged)
+
+    def to_dict(self) -> dict[str, str]:
+        """Descriptive fields as JSON-ready values (no detection rules)."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "category": self.category,
+            "severity": self.severity,
+            "description": self.description,
+            "suggestion": self.suggestion,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -326,6 +361,58 @@ EXAMPLE_KEYWORDS: tuple[str, ...] = (
     "here is what i mean",
 )
 
+def compile_bank(words: tuple[str, ...], flags: int) -> re.Pattern[str]:
+    """Compile a whole-word alternation of ``words`` with the given ``flags``."""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + r")\b", flags)
+
+
+# Keyword banks by id, as reported by scan_keyword_banks()
+KEYWORD_BANKS: dict[str, tuple[str, ...]] = {
+    "role": ROLE_KEYWORDS,
+    "output_format": OUTPUT_FORMAT_KEYWORDS,
+    "context": CONTEXT_SIGNALS,
+    "constraint": CONSTRAINT_KEYWORDS,
+    "example": EXAMPLE_KEYWORDS,
+}
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every keyword bank."""
+    banks_by_keyword: dict[str, list[str]] = {}
+    for bank_id, keywords in KEYWORD_BANKS.items():
+        for kw in keywords:
+            banks_by_keyword.setdefault(kw, []).append(bank_id)
+
+    automaton = ahocorasick.Automaton()
+    for kw, bank_ids in banks_by_keyword.items():
+        automaton.add_word(kw, (tuple(bank_ids), kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+
+def scan_keyword_banks(text_lower: str) -> dict[str, set[str]]:
+    """Return the keywords of each bank that occur in ``text_lower``.
+
+    Keywords match as plain substrings. With ``pyahocorasick`` installed the
+    text is scanned once for all banks; otherwise each keyword is searched
+    for separately.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return {
+            bank_id: {kw for kw in keywords if kw in text_lower}
+            for bank_id, keywords in KEYWORD_BANKS.items()
+        }
+
+    hits: dict[str, set[str]] = {bank_id: set() for bank_id in KEYWORD_BANKS}
+    for _end, (bank_ids, kw) in _KEYWORD_AUTOMATON.iter(text_lower):
+        for bank_id in bank_ids:
+            hits[bank_id].add(kw)
+    return hits
+
+
 # Collect all defined anti-patterns for easy iteration
 ALL_PATTERNS: tuple[AntiPattern, ...] = (
     MISSING_ROLE,
@@ -337,3 +424,10 @@ ALL_PATTERNS: tuple[AntiPattern, ...] = (
     NO_EXAMPLES,
     MULTIPLE_REQUESTS,
 )
+
+# Lookups derived from ALL_PATTERNS, built once at import
+PATTERNS_BY_ID: dict[str, AntiPattern] = {ap.id: ap for ap in ALL_PATTERNS}
+PATTERNS_BY_CATEGORY: dict[Category, tuple[AntiPattern, ...]] = {
+    category: tuple(ap for ap in ALL_PATTERNS if ap.category is category)
+    for category in Category
+}
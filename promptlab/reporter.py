@@ -9,9 +9,11 @@ Supports three output modes:
 from __future__ import annotations
 
 import json
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -19,69 +21,106 @@ from rich.text import Text
 from promptlab.analyzer import AnalysisResult, DimensionScore
 from promptlab.enhancer import EnhancementResult
 
+try:  # optional: C JSON encoder (pip install promptlab[fast])
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+# Score color bands: <4 red, <6 dark orange, <8 yellow, otherwise green
+_SCORE_THRESHOLDS: tuple[float, ...] = (4, 6, 8)
+_SCORE_COLORS: tuple[str, ...] = ("red", "dark_orange", "yellow", "green")
+
+_SEVERITY_COLORS: dict[str, str] = {"high": "red", "medium": "yellow", "low": "blue"}
+
 
 def _score_color(score: float) -> str:
     """Return a Rich color name based on score value."""
-    if score >= 8:
-        return "green"
-    if score >= 6:
-        return "yellow"
-    if score >= 4:
-        return "dark_orange"
-    return "red"
+    return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
+
+
+def _build_bar(filled: int, width: int) -> str:
+    return f"[{'=' * filled}{'-' * (width - filled)}]"
+
+
+# Every bar for the common widths, indexed by the number of filled cells
+_BAR_CACHE: dict[int, tuple[str, ...]] = {
+    width: tuple(_build_bar(filled, width) for filled in range(width + 1))
+    for width in (10, 20, 30)
+}
 
 
 def _score_bar(score: float, width: int = 20) -> str:
     """Build a text-based progress bar for a score (1-10)."""
     filled = round((score / 10) * width)
-    empty = width - filled
-    return f"[{'=' * filled}{'-' * empty}]"
+    bars = _BAR_CACHE.get(width)
+    if bars is not None and 0 <= filled <= width:
+        return bars[filled]
+    return _build_bar(filled, width)
+
 
+# Markdown row templates, bound once and filled per row
+_MD_DIMENSION_ROW = "| {name} | {score}/10 | {label} | {details} |".format
+_MD_ANTI_PATTERN_ROW = "- **[{severity}] {name}**: {description}".format
 
-def _severity_color(severity_value: str) -> str:
+
+def _severity_color(severity: str) -> str:
     """Map severity level to a color."""
-    return {"high": "red", "medium": "yellow", "low": "blue"}.get(severity_value, "white")
+    return _SEVERITY_COLORS.get(severity, "white")
 
 
 # ---------------------------------------------------------------------------
 # Rich (text) output
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _default_console() -> Console:
+    """Shared console for callers that don't pass one; built on first use."""
+    return Console()
+
+
 def render_text(
     result: AnalysisResult,
     enhancement: Optional[EnhancementResult] = None,
     console: Optional[Console] = None,
 ) -> None:
-    """Print a fully formatted analysis report to the terminal using Rich."""
+    """Print a fully formatted analysis report to the terminal using Rich.
+
+    The report is assembled as one renderable group and printed in a single
+    call; an empty string stands for a blank line.
+    """
     if console is None:
-        console = Console()
+        console = _default_console()
 
     # Header
-    console.print()
-    console.print(
+    parts: list[RenderableType] = [
+        "",
         Panel(
             Text("PromptLab Analysis Report", style="bold cyan", justify="center"),
             border_style="cyan",
-        )
-    )
-    console.print()
+        ),
+        "",
+    ]
 
     # Prompt preview (truncated if long)
     preview = result.prompt[:200]
     if len(result.prompt) > 200:
         preview += "..."
-    console.print(Panel(preview, title="Prompt", border_style="dim"))
-    console.print()
+    parts += [Panel(preview, title="Prompt", border_style="dim"), ""]
 
     # Quick stats
-    console.print(f"  [dim]Words:[/] {result.word_count}    [dim]Sentences:[/] {result.sentence_count}")
-    console.print()
+    parts += [
+        f"  [dim]Words:[/] {result.word_count}    [dim]Sentences:[/] {result.sentence_count}",
+        "",
+    ]
 
     # Overall score
     color = _score_color(result.overall_score)
-    console.print(f"  [bold]Overall Score:[/] [{color} bold]{result.overall_score}/10[/] ({result.overall_label})")
-    console.print(f"  {_score_bar(result.overall_score, 30)}")
-    console.print()
+    parts += [
+        f"  [bold]Overall Score:[/] [{color} bold]{result.overall_score}/10[/] ({result.overall_label})",
+        f"  {_score_bar(result.overall_score, 30)}",
+        "",
+    ]
 
     # Dimension scores table
     table = Table(title="Dimension Scores", show_header=True, header_style="bold cyan")
@@ -92,7 +131,6 @@ def render_text(
 
     for dim in result.dimensions:
         color = _score_color(dim.score)
-        bar = _score_bar(dim.score, 10)
         table.add_row(
             dim.name,
             f"[{color}]{dim.score}/10[/]",
@@ -100,96 +138,80 @@ def render_text(
             dim.details,
         )
 
-    console.print(table)
-    console.print()
+    parts += [table, ""]
 
     # Anti-patterns
     if result.anti_patterns:
-        console.print("[bold red]Anti-Patterns Detected[/]")
-        console.print()
+        parts += ["[bold red]Anti-Patterns Detected[/]", ""]
         for det in result.anti_patterns:
-            sev_color = _severity_color(det.pattern.severity.value)
-            console.print(
-                f"  [{sev_color}][{det.pattern.severity.value.upper()}][/] "
+            sev_color = _severity_color(det.pattern.severity)
+            parts.append(
+                f"  [{sev_color}][{det.pattern.severity.upper()}][/] "
                 f"[bold]{det.pattern.name}[/]"
             )
-            console.print(f"      {det.pattern.description}")
+            parts.append(f"      {det.pattern.description}")
             if det.evidence:
-                console.print(f"      [dim]Evidence: {det.evidence}[/]")
-            console.print()
+                parts.append(f"      [dim]Evidence: {det.evidence}[/]")
+            parts.append("")
 
     # Suggestions
     if result.suggestions:
-        console.print("[bold green]Suggestions for Improvement[/]")
-        console.print()
+        parts += ["[bold green]Suggestions for Improvement[/]", ""]
         for i, suggestion in enumerate(result.suggestions, 1):
-            console.print(f"  {i}. {suggestion}")
-            console.print()
+            parts += [f"  {i}. {suggestion}", ""]
 
     # Enhancement (if present)
     if enhancement:
-        console.print(
+        parts += [
             Panel(
                 enhancement.improved_prompt,
                 title=f"AI-Enhanced Prompt ({enhancement.provider}/{enhancement.model})",
                 border_style="magenta",
-            )
-        )
-        console.print()
+            ),
+            "",
+        ]
         if enhancement.explanation:
-            console.print(f"  [dim]{enhancement.explanation}[/]")
-            console.print()
+            parts += [f"  [dim]{enhancement.explanation}[/]", ""]
+
+    console.print(Group(*parts))
 
 
 # ---------------------------------------------------------------------------
 # JSON output
 # ---------------------------------------------------------------------------
 
+def _dumps(data: dict, compact: bool) -> str:
+    """Serialize ``data`` with orjson when installed, else the json module.
+
+    Both produce the same layout; orjson writes non-ASCII characters as
+    UTF-8 rather than ``\\u`` escapes. Text orjson rejects (lone surrogates
+    from undecodable input) goes through the json module instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+    if compact:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
+
+
 def render_json(
     result: AnalysisResult,
     enhancement: Optional[EnhancementResult] = None,
+    compact: bool = False,
 ) -> str:
-    """Return the analysis as a JSON string."""
-    data = {
-        "prompt": result.prompt,
-        "overall_score": result.overall_score,
-        "overall_label": result.overall_label,
-        "word_count": result.word_count,
-        "sentence_count": result.sentence_count,
-        "dimensions": [
-            {
-                "name": d.name,
-                "score": d.score,
-                "max_score": d.max_score,
-                "label": d.label,
-                "details": d.details,
-            }
-            for d in result.dimensions
-        ],
-        "anti_patterns": [
-            {
-                "id": d.pattern.id,
-                "name": d.pattern.name,
-                "category": d.pattern.category.value,
-                "severity": d.pattern.severity.value,
-                "description": d.pattern.description,
-                "suggestion": d.pattern.suggestion,
-                "evidence": d.evidence,
-            }
-            for d in result.anti_patterns
-        ],
-        "suggestions": result.suggestions,
-    }
+    """Return the analysis as a JSON string.
 
+    Pretty-printed with a 2-space indent by default; ``compact=True`` drops
+    all optional whitespace.
+    """
+    data = result.to_dict()
     if enhancement:
-        data["enhancement"] = {
-            "improved_prompt": enhancement.improved_prompt,
-            "explanation": enhancement.explanation,
-            "provider": enhancement.provider,
-            "model": enhancement.model,
-        }
+        data["enhancement"] = enhancement.to_dict()
 
-    return json.dumps(data, indent=2)
+    return _dumps(data, compact)
 
 
 # ---------------------------------------------------------------------------
@@ -225,8 +247,10 @@ def render_markdown(
     lines.append("")
     lines.append("| Dimension | Score | Rating | Details |")
     lines.append("|-----------|-------|--------|---------|")
-    for dim in result.dimensions:
-        lines.append(f"| {dim.name} | {dim.score}/10 | {dim.label} | {dim.details} |")
+    lines.extend(
+        _MD_DIMENSION_ROW(name=d.name, score=d.score, label=d.label, details=d.details)
+        for d in result.dimensions
+    )
     lines.append("")
 
     # Anti-patterns
@@ -235,8 +259,11 @@ def render_markdown(
         lines.append("")
         for det in result.anti_patterns:
             lines.append(
-                f"- **[{det.pattern.severity.value.upper()}] {det.pattern.name}**: "
-                f"{det.pattern.description}"
+                _MD_ANTI_PATTERN_ROW(
+                    severity=det.pattern.severity.upper(),
+                    name=det.pattern.name,
+                    description=det.pattern.description,
+                )
             )
             if det.evidence:
                 lines.append(f"  - *Evidence:* {det.evidence}")
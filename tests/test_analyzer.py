@@ -8,18 +8,31 @@ quality levels.
 
 from __future__ import annotations
 
+import io
 import json
 
 import pytest
+from rich.console import Console
 
 from promptlab.analyzer import (
     AnalysisResult,
     DimensionScore,
     analyze,
+    analyze_many,
+    _analyze_uncached,
+    _count_distinct_tasks,
     _count_words,
     _count_sentences,
 )
-from promptlab.reporter import render_json, render_markdown
+from promptlab import patterns, reporter
+from promptlab.patterns import (
+    ALL_PATTERNS,
+    PATTERNS_BY_CATEGORY,
+    PATTERNS_BY_ID,
+    Category,
+    scan_keyword_banks,
+)
+from promptlab.reporter import _score_bar, _score_color, render_json, render_markdown, render_text
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +87,30 @@ class TestHelpers:
     def test_count_sentences_single(self):
         assert _count_sentences("Just one sentence") == 1
 
+    def test_distinct_tasks_split_on_unicode_whitespace(self):
+        text = "Write a poem.\u00a0Explain the rhyme.\u2003Summarize it."
+        assert _count_distinct_tasks(text) == 3
+
+    def test_vague_phrase_split_by_no_break_space(self):
+        result = analyze("Please make\u00a0it better for the client")
+        assert "vague_language" in {d.pattern.id for d in result.anti_patterns}
+
+    def test_keyword_hits_match_inside_words(self):
+        # Banks match as substrings, so "requirements" counts as "requirement"
+        assert scan_keyword_banks("list the requirements")["constraint"] == {"requirement"}
+
+    def test_pattern_lookups(self):
+        assert PATTERNS_BY_ID["missing_role"].id == "missing_role"
+        assert len(PATTERNS_BY_ID) == len(ALL_PATTERNS)
+        assert PATTERNS_BY_CATEGORY[Category.SCOPE] == (PATTERNS_BY_ID["multiple_requests"],)
+        assert sum(len(aps) for aps in PATTERNS_BY_CATEGORY.values()) == len(ALL_PATTERNS)
+
+    def test_keyword_scan_without_automaton(self, monkeypatch):
+        text = "you are an editor. for example, keep it under 50 words as a list."
+        expected = scan_keyword_banks(text)
+        monkeypatch.setattr(patterns, "_KEYWORD_AUTOMATON", None)
+        assert scan_keyword_banks(text) == expected
+
 
 # ---------------------------------------------------------------------------
 # Dimension score tests
@@ -99,6 +136,40 @@ class TestDimensionScore:
     def test_label_poor(self):
         assert DimensionScore(name="T", score=1.0).label == "Poor"
 
+    @pytest.mark.parametrize(
+        "score, label",
+        [(float("nan"), "Poor"), (float("-inf"), "Poor"), (-3.0, "Poor"),
+         (float("inf"), "Excellent"), (12.0, "Excellent"), (7.99, "Good")],
+    )
+    def test_label_out_of_range(self, score, label):
+        assert DimensionScore(name="T", score=score).label == label
+
+
+class TestAnalysisResult:
+    def test_overall_score_is_weighted(self):
+        result = AnalysisResult(
+            prompt="x",
+            dimensions=[
+                DimensionScore(name="Clarity", score=10.0),
+                DimensionScore(name="Length", score=5.0),
+            ],
+        )
+        assert result.overall_score == 8.0
+        assert result.overall_label == "Excellent"
+
+    def test_overall_score_without_dimensions(self):
+        assert AnalysisResult(prompt="x").overall_score == 0.0
+
+    def test_to_dict(self):
+        result = analyze(BAD_PROMPT)
+        data = result.to_dict()
+        assert data["overall_label"] == result.overall_label
+        assert data["dimensions"][0]["label"] == result.dimensions[0].label
+        assert data["anti_patterns"][0]["severity"] == result.anti_patterns[0].pattern.severity
+        assert str(data["anti_patterns"][0]["severity"]) in {"low", "medium", "high"}
+        assert data["suggestions"] == result.suggestions
+        assert data["suggestions"] is not result.suggestions
+
 
 # ---------------------------------------------------------------------------
 # Full analysis tests
@@ -107,9 +178,9 @@ class TestDimensionScore:
 class TestAnalyzeBadPrompt:
     """A short, vague prompt should score poorly."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(BAD_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(BAD_PROMPT)
 
     def test_overall_score_is_low(self):
         assert self.result.overall_score < 5.0
@@ -135,9 +206,9 @@ class TestAnalyzeBadPrompt:
 class TestAnalyzeGoodPrompt:
     """A well-structured prompt should score highly."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(GOOD_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(GOOD_PROMPT)
 
     def test_overall_score_is_high(self):
         assert self.result.overall_score >= 7.0
@@ -159,9 +230,9 @@ class TestAnalyzeGoodPrompt:
 class TestAnalyzeVaguePrompt:
     """A prompt full of vague language should be flagged."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(VAGUE_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(VAGUE_PROMPT)
 
     def test_clarity_is_low(self):
         clarity = next(d for d in self.result.dimensions if d.name == "Clarity")
@@ -175,9 +246,9 @@ class TestAnalyzeVaguePrompt:
 class TestAnalyzeMultiTaskPrompt:
     """A prompt asking for multiple unrelated things should be detected."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(MULTI_TASK_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(MULTI_TASK_PROMPT)
 
     def test_detects_multiple_requests(self):
         ids = {d.pattern.id for d in self.result.anti_patterns}
@@ -187,9 +258,9 @@ class TestAnalyzeMultiTaskPrompt:
 class TestAnalyzeMediumPrompt:
     """A decent but not great prompt should land in the middle."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(MEDIUM_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(MEDIUM_PROMPT)
 
     def test_overall_score_is_moderate(self):
         assert 4.0 <= self.result.overall_score <= 8.0
@@ -199,12 +270,28 @@ class TestAnalyzeMediumPrompt:
         assert structure.score >= 2.5  # Has task verb at minimum
 
 
+class TestAnalyzeShortPrompts:
+    """Prompts under five words still get a full, content-dependent analysis."""
+
+    def test_role_is_still_detected(self):
+        ids = {d.pattern.id for d in analyze("You are a poet").anti_patterns}
+        assert "missing_role" not in ids
+
+    def test_ambiguous_pronoun_is_still_detected(self):
+        ids = {d.pattern.id for d in analyze("Fix it").anti_patterns}
+        assert "ambiguous_pronouns" in ids
+
+    def test_multiple_questions_are_still_detected(self):
+        ids = {d.pattern.id for d in analyze("Why? How? What?").anti_patterns}
+        assert "multiple_requests" in ids
+
+
 class TestAnalyzeEmptyPrompt:
     """An empty prompt should return minimum scores."""
 
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze("")
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze("")
 
     def test_all_dimensions_are_1(self):
         for dim in self.result.dimensions:
@@ -214,14 +301,45 @@ class TestAnalyzeEmptyPrompt:
         assert self.result.overall_score == 1.0
 
 
+class TestAnalyzeMany:
+    """Batch analysis should match analyzing each prompt on its own."""
+
+    PROMPTS = [BAD_PROMPT, GOOD_PROMPT, VAGUE_PROMPT, ""]
+
+    def test_matches_single_analysis(self):
+        assert analyze_many(self.PROMPTS) == [_analyze_uncached(p) for p in self.PROMPTS]
+
+    def test_preserves_order_with_workers(self):
+        results = analyze_many(self.PROMPTS, workers=2)
+        assert [r.overall_score for r in results] == [
+            _analyze_uncached(p).overall_score for p in self.PROMPTS
+        ]
+
+    def test_empty_batch(self):
+        assert analyze_many([]) == []
+
+
+class TestAnalyzeCache:
+    def test_repeated_prompt_returns_cached_result(self):
+        assert analyze(MEDIUM_PROMPT) is analyze(MEDIUM_PROMPT)
+
+    def test_cached_result_matches_fresh_analysis(self):
+        assert analyze(MEDIUM_PROMPT) == _analyze_uncached(MEDIUM_PROMPT)
+
+    def test_long_prompt_is_not_cached(self):
+        prompt = MEDIUM_PROMPT + " detail" * 2_000
+        assert analyze(prompt) is not analyze(prompt)
+        assert analyze(prompt) == _analyze_uncached(prompt)
+
+
 # ---------------------------------------------------------------------------
 # Output rendering tests
 # ---------------------------------------------------------------------------
 
 class TestRenderers:
-    @pytest.fixture(autouse=True)
-    def _analyze(self):
-        self.result = analyze(BAD_PROMPT)
+    @classmethod
+    def setup_class(cls):
+        cls.result = analyze(BAD_PROMPT)
 
     def test_json_output_is_valid(self):
         output = render_json(self.result)
@@ -236,6 +354,23 @@ class TestRenderers:
         data = json.loads(output)
         assert data["overall_score"] == self.result.overall_score
 
+    def test_compact_json_matches_indented(self):
+        compact = render_json(self.result, compact=True)
+        assert "\n" not in compact
+        assert json.loads(compact) == json.loads(render_json(self.result))
+
+    def test_json_without_orjson(self, monkeypatch):
+        expected = json.loads(render_json(self.result))
+        monkeypatch.setattr(reporter, "orjson", None)
+        assert json.loads(render_json(self.result)) == expected
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_json_with_surrogates(self, compact):
+        # Undecodable argv/stdin bytes arrive as lone surrogates
+        result = analyze("Write a poem \udcff about dogs")
+        data = json.loads(render_json(result, compact=compact))
+        assert data["prompt"] == "Write a poem \udcff about dogs"
+
     def test_markdown_contains_headers(self):
         output = render_markdown(self.result)
         assert "# PromptLab Analysis Report" in output
@@ -244,3 +379,31 @@ class TestRenderers:
     def test_markdown_contains_table(self):
         output = render_markdown(self.result)
         assert "| Dimension |" in output
+
+    @pytest.mark.parametrize(
+        "score, color",
+        [(1.0, "red"), (3.9, "red"), (4.0, "dark_orange"), (6.0, "yellow"),
+         (7.9, "yellow"), (8.0, "green"), (10.0, "green")],
+    )
+    def test_score_color_bands(self, score, color):
+        assert _score_color(score) == color
+
+    @pytest.mark.parametrize("width", [10, 20, 30, 7])
+    def test_score_bar(self, width):
+        bar = _score_bar(5.0, width)
+        assert len(bar) == width + 2
+        assert bar.count("=") == round(width / 2)
+
+    def test_text_report_default_console(self, capsys):
+        render_text(self.result)
+        render_text(self.result)
+        assert capsys.readouterr().out.count("PromptLab Analysis Report") == 2
+
+    def test_text_report_contains_sections(self):
+        buf = io.StringIO()
+        render_text(self.result, console=Console(file=buf, width=100))
+        output = buf.getvalue()
+        assert "PromptLab Analysis Report" in output
+        assert "Dimension Scores" in output
+        assert "Anti-Patterns Detected" in output
+        assert "Suggestions for Improvement" in output
@@ -0,0 +1,40 @@
+"""Tests for CLI input handling."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from promptlab import cli
+
+
+@pytest.fixture
+def small_limit(monkeypatch):
+    monkeypatch.setattr(cli, "MAX_PROMPT_CHARS", 10)
+
+
+class TestReadPrompt:
+    def test_argument_is_returned_as_is(self):
+        assert cli._read_prompt("Write a haiku", None) == "Write a haiku"
+
+    def test_file_is_read(self, tmp_path):
+        path = tmp_path / "prompt.txt"
+        path.write_text("Write a haiku", encoding="utf-8")
+        assert cli._read_prompt(None, str(path)) == "Write a haiku"
+
+    def test_long_file_is_truncated(self, tmp_path, small_limit, capsys):
+        path = tmp_path / "prompt.txt"
+        path.write_text("x" * 50, encoding="utf-8")
+        assert cli._read_prompt(None, str(path)) == "x" * 10
+        assert "Warning" in capsys.readouterr().err
+
+    def test_long_stdin_is_truncated(self, monkeypatch, small_limit, capsys):
+        monkeypatch.setattr(cli.sys, "stdin", io.StringIO("y" * 50))
+        assert cli._read_prompt(None, None) == "y" * 10
+        assert "Warning" in capsys.readouterr().err
+
+    def test_input_at_limit_is_not_truncated(self, monkeypatch, small_limit, capsys):
+        monkeypatch.setattr(cli.sys, "stdin", io.StringIO("z" * 10))
+        assert cli._read_prompt(None, None) == "z" * 10
+        assert capsys.readouterr().err == ""